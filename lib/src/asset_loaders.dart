@@ -151,18 +151,25 @@ class MemoryAssetLoader {
 /// Caching wrapper for asset loaders
 class CachingAssetLoader {
   final AssetLoader _baseLoader;
-  final Map<String, String> _cache = {};
+  final Map<String, Future<String>> _cache = {};
 
   CachingAssetLoader(this._baseLoader);
 
   AssetLoader create() {
-    return (String assetPath) async {
-      if (_cache.containsKey(assetPath)) {
-        return _cache[assetPath]!;
-      }
+    return (String assetPath) {
+      // The pending load is cached too, so concurrent requests share one read
+      final cached = _cache[assetPath];
+      if (cached != null) return cached;
 
-      final content = await _baseLoader(assetPath);
+      final content = Future.sync(() => _baseLoader(assetPath));
       _cache[assetPath] = content;
+      content.then<void>(
+        (_) {},
+        onError: (Object _) {
+          // Forget failed loads so a later request can try again
+          if (identical(_cache[assetPath], content)) _cache.remove(assetPath);
+        },
+      );
       return content;
     };
   }
@@ -12,6 +12,11 @@ bool _isConfessionInitialized = false;
 bool _isShorterCatechismInitialized = false;
 bool _isLargerCatechismInitialized = false;
 
+// Loads in progress, shared so concurrent callers read each document once
+Future<List<ConfessionChapter>>? _pendingConfession;
+Future<List<CatechismItem>>? _pendingShorterCatechism;
+Future<List<CatechismItem>>? _pendingLargerCatechism;
+
 /// Initialize the Westminster Standards data
 /// Call this once at app startup for optimal performance
 /// [documents] specifies which documents to load (defaults to all)
@@ -20,21 +25,27 @@ Future<void> initializeWestminsterStandards([
 ]) async {
   switch (documents) {
     case WestminsterDocument.confession:
-      _cachedConfession = await loadWestminsterConfession();
+      _cachedConfession = await _loadConfession();
       _isConfessionInitialized = true;
       break;
     case WestminsterDocument.shorterCatechism:
-      _cachedShorterCatechism = await loadWestminsterShorterCatechism();
+      _cachedShorterCatechism = await _loadShorterCatechism();
       _isShorterCatechismInitialized = true;
       break;
     case WestminsterDocument.largerCatechism:
-      _cachedLargerCatechism = await loadWestminsterLargerCatechism();
+      _cachedLargerCatechism = await _loadLargerCatechism();
       _isLargerCatechismInitialized = true;
       break;
     case WestminsterDocument.all:
-      _cachedConfession = await loadWestminsterConfession();
-      _cachedShorterCatechism = await loadWestminsterShorterCatechism();
-      _cachedLargerCatechism = await loadWestminsterLargerCatechism();
+      // The documents are independent, so load them concurrently
+      final results = await Future.wait<Object>([
+        _loadConfession(),
+        _loadShorterCatechism(),
+        _loadLargerCatechism(),
+      ]);
+      _cachedConfession = results[0] as List<ConfessionChapter>;
+      _cachedShorterCatechism = results[1] as List<CatechismItem>;
+      _cachedLargerCatechism = results[2] as List<CatechismItem>;
       _isConfessionInitialized = true;
       _isShorterCatechismInitialized = true;
       _isLargerCatechismInitialized = true;
@@ -42,6 +53,25 @@ Future<void> initializeWestminsterStandards([
   }
 }
 
+/// Helper function to load the confession, joining any load in progress
+Future<List<ConfessionChapter>> _loadConfession() {
+  return _pendingConfession ??= loadWestminsterConfession().whenComplete(
+    () => _pendingConfession = null,
+  );
+}
+
+/// Helper function to load the shorter catechism, joining any load in progress
+Future<List<CatechismItem>> _loadShorterCatechism() {
+  return _pendingShorterCatechism ??= loadWestminsterShorterCatechism()
+      .whenComplete(() => _pendingShorterCatechism = null);
+}
+
+/// Helper function to load the larger catechism, joining any load in progress
+Future<List<CatechismItem>> _loadLargerCatechism() {
+  return _pendingLargerCatechism ??= loadWestminsterLargerCatechism()
+      .whenComplete(() => _pendingLargerCatechism = null);
+}
+
 /// Check if all documents are initialized
 bool get isInitialized {
   return _isConfessionInitialized &&
@@ -3,16 +3,16 @@
 
 import '../models.dart';
 import '../types.dart';
+import '../search_matching.dart';
 
 /// Extensions for collections of CatechismItem
 extension CatechismItemsIterable on Iterable<CatechismItem> {
   /// Find a catechism question by number
   CatechismItem? findByNumber(int number) {
-    try {
-      return firstWhere((item) => item.number == number);
-    } catch (e) {
-      return null;
+    for (final item in this) {
+      if (item.number == number) return item;
     }
+    return null;
   }
 
   /// Get questions in a range (inclusive)
@@ -23,7 +23,8 @@ extension CatechismItemsIterable on Iterable<CatechismItem> {
 
   /// Get questions by specific numbers
   List<CatechismItem> getByNumbers(List<int> numbers) {
-    return where((item) => numbers.contains(item.number)).toList()
+    final numberSet = numbers.toSet();
+    return where((item) => numberSet.contains(item.number)).toList()
       ..sort((a, b) => a.number.compareTo(b.number));
   }
 
@@ -39,38 +40,7 @@ extension CatechismItemsIterable on Iterable<CatechismItem> {
 
   /// Search in specific parts of catechism items
   List<CatechismItem> searchInParts(String query, CatechismItemPart part) {
-    final lowerQuery = query.toLowerCase();
-    return where((item) {
-      switch (part) {
-        case CatechismItemPart.question:
-          return item.question.toLowerCase().contains(lowerQuery);
-        case CatechismItemPart.answer:
-          return item.answer.toLowerCase().contains(lowerQuery);
-        case CatechismItemPart.references:
-          return item.allProofTexts.any(
-            (pt) => pt.reference.toLowerCase().contains(lowerQuery),
-          );
-        case CatechismItemPart.questionAndAnswer:
-          return item.question.toLowerCase().contains(lowerQuery) ||
-              item.answer.toLowerCase().contains(lowerQuery);
-        case CatechismItemPart.questionAndReferences:
-          return item.question.toLowerCase().contains(lowerQuery) ||
-              item.allProofTexts.any(
-                (pt) => pt.reference.toLowerCase().contains(lowerQuery),
-              );
-        case CatechismItemPart.answerAndReferences:
-          return item.answer.toLowerCase().contains(lowerQuery) ||
-              item.allProofTexts.any(
-                (pt) => pt.reference.toLowerCase().contains(lowerQuery),
-              );
-        case CatechismItemPart.all:
-          return item.question.toLowerCase().contains(lowerQuery) ||
-              item.answer.toLowerCase().contains(lowerQuery) ||
-              item.allProofTexts.any(
-                (pt) => pt.reference.toLowerCase().contains(lowerQuery),
-              );
-      }
-    }).toList();
+    return where(catechismItemMatcher(query, part)).toList();
   }
 
   /// Get all proof texts from all items
@@ -104,11 +74,10 @@ extension CatechismItemsIterable on Iterable<CatechismItem> {
 extension ConfessionChaptersIterable on Iterable<ConfessionChapter> {
   /// Find a chapter by number
   ConfessionChapter? findByNumber(int number) {
-    try {
-      return firstWhere((chapter) => chapter.number == number);
-    } catch (e) {
-      return null;
+    for (final chapter in this) {
+      if (chapter.number == number) return chapter;
     }
+    return null;
   }
 
   /// Get chapters in a range (inclusive)
@@ -121,7 +90,8 @@ extension ConfessionChaptersIterable on Iterable<ConfessionChapter> {
 
   /// Get chapters by specific numbers
   List<ConfessionChapter> getByNumbers(List<int> numbers) {
-    return where((chapter) => numbers.contains(chapter.number)).toList()
+    final numberSet = numbers.toSet();
+    return where((chapter) => numberSet.contains(chapter.number)).toList()
       ..sort((a, b) => a.number.compareTo(b.number));
   }
 
@@ -33,7 +33,8 @@ extension CatechismItemExtensions on CatechismItem {
   int get proofTextCount => allProofTexts.length;
 
   /// Check if this item has proof texts
-  bool get hasProofTexts => allProofTexts.isNotEmpty;
+  bool get hasProofTexts =>
+      clauses.any((clause) => clause.proofTexts.isNotEmpty);
 
   /// Get unique scripture references
   List<String> get uniqueReferences {
@@ -104,7 +105,7 @@ extension ConfessionChapterExtensions on ConfessionChapter {
   int get proofTextCount => allProofTexts.length;
 
   /// Check if this chapter has proof texts
-  bool get hasProofTexts => allProofTexts.isNotEmpty;
+  bool get hasProofTexts => sections.any((section) => section.hasProofTexts);
 
   /// Get unique scripture references
   List<String> get uniqueReferences {
@@ -161,7 +162,8 @@ extension ConfessionSectionExtensions on ConfessionSection {
   int get proofTextCount => allProofTexts.length;
 
   /// Check if this section has proof texts
-  bool get hasProofTexts => allProofTexts.isNotEmpty;
+  bool get hasProofTexts =>
+      clauses.any((clause) => clause.proofTexts.isNotEmpty);
 
   /// Get unique scripture references
   List<String> get uniqueReferences {
@@ -136,15 +136,21 @@ extension WestminsterSearchResultsIterable
 
   /// Get a summary of the search results
   String get searchSummary {
-    final total = length;
-    final byDoc = groupedByDocument;
-    final byMatch = groupedByMatchType;
+    // Tally everything in a single pass instead of grouping the results twice
+    var total = 0;
+    final byDoc = <WestminsterDocumentType, int>{};
+    final byMatch = <SearchMatchType, int>{};
+    for (final result in this) {
+      total++;
+      byDoc.update(result.documentType, (n) => n + 1, ifAbsent: () => 1);
+      byMatch.update(result.matchType, (n) => n + 1, ifAbsent: () => 1);
+    }
 
     final docSummary = byDoc.entries
-        .map((e) => '${e.key.name}: ${e.value.length}')
+        .map((e) => '${e.key.name}: ${e.value}')
         .join(', ');
     final matchSummary = byMatch.entries
-        .map((e) => '${e.key.name}: ${e.value.length}')
+        .map((e) => '${e.key.name}: ${e.value}')
         .join(', ');
 
     return 'Found $total results ($docSummary) - Match types: $matchSummary';
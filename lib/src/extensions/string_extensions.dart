@@ -5,18 +5,23 @@
 extension WestminsterTextExtensions on String {
   /// Remove scripture references from text (e.g., [Gen 1:1])
   String get withoutScriptureReferences {
-    return replaceAll(RegExp(r'\[[^\]]+\]'), '').trim();
+    // Most text has no brackets at all, so skip the regex for it
+    if (!contains('[')) return trim();
+    return replaceAll(_bracketedReference, '').trim();
   }
 
   /// Extract scripture references from text
   List<String> get scriptureReferences {
-    final matches = RegExp(r'\[([^\]]+)\]').allMatches(this);
+    if (!contains('[')) return [];
+    final matches = _bracketedReferenceGroup.allMatches(this);
     return matches.map((m) => m.group(1)!).toList();
   }
 
   /// Highlight search terms in text with markdown-style bold
   String highlightSearchTerm(String searchTerm) {
-    final regex = RegExp(searchTerm, caseSensitive: false);
+    if (searchTerm.isEmpty) return this;
+    // Match the term literally so user input is never run as a pattern
+    final regex = RegExp(RegExp.escape(searchTerm), caseSensitive: false);
     return replaceAllMapped(regex, (match) => '**${match.group(0)}**');
   }
 
@@ -28,34 +33,44 @@ extension WestminsterTextExtensions on String {
 
   /// Count words in the text
   int get wordCount {
-    return split(RegExp(r'\s+')).where((word) => word.isNotEmpty).length;
+    var count = 0;
+    var inWord = false;
+    for (var i = 0; i < length; i++) {
+      if (_isWhitespace(codeUnitAt(i))) {
+        inWord = false;
+      } else if (!inWord) {
+        inWord = true;
+        count++;
+      }
+    }
+    return count;
   }
 
   /// Check if text contains any scripture references
   bool get hasScriptureReferences {
-    return RegExp(r'\[[^\]]+\]').hasMatch(this);
+    return contains('[') && _bracketedReference.hasMatch(this);
   }
 
   /// Get text with scripture references formatted as links
   String get withScriptureLinks {
+    if (!contains('[')) return this;
     return replaceAllMapped(
-      RegExp(r'\[([^\]]+)\]'),
+      _bracketedReferenceGroup,
       (match) => '[${match.group(1)}](scripture://${match.group(1)})',
     );
   }
 
   /// Clean up extra whitespace and normalize line breaks
   String get normalized {
-    return replaceAll(
-      RegExp(r'\s+'),
-      ' ',
-    ).replaceAll(RegExp(r'\n\s*\n'), '\n\n').trim();
+    // Every whitespace run, line breaks included, collapses to a single space
+    // in one pass, so no blank lines are left to normalize afterwards
+    return replaceAll(_whitespaceRun, ' ').trim();
   }
 
   /// Split text into sentences
   List<String> get sentences {
     return split(
-      RegExp(r'[.!?]+'),
+      _sentenceEnd,
     ).map((s) => s.trim()).where((s) => s.isNotEmpty).toList();
   }
 
@@ -65,3 +80,32 @@ extension WestminsterTextExtensions on String {
     return sentences.isNotEmpty ? sentences.first : this;
   }
 }
+
+// Patterns are compiled once and shared by every call
+
+/// A scripture reference in square brackets, e.g. `[Gen 1:1]`
+final _bracketedReference = RegExp(r'\[[^\]]+\]');
+
+/// A scripture reference in square brackets, capturing the reference itself
+final _bracketedReferenceGroup = RegExp(r'\[([^\]]+)\]');
+
+/// A run of whitespace characters
+final _whitespaceRun = RegExp(r'\s+');
+
+/// One or more sentence-ending punctuation marks
+final _sentenceEnd = RegExp(r'[.!?]+');
+
+/// Whether [codeUnit] is one of the characters matched by `\s` in a [RegExp]
+bool _isWhitespace(int codeUnit) {
+  return (codeUnit >= 0x09 && codeUnit <= 0x0D) ||
+      codeUnit == 0x20 ||
+      codeUnit == 0xA0 ||
+      codeUnit == 0x1680 ||
+      (codeUnit >= 0x2000 && codeUnit <= 0x200A) ||
+      codeUnit == 0x2028 ||
+      codeUnit == 0x2029 ||
+      codeUnit == 0x202F ||
+      codeUnit == 0x205F ||
+      codeUnit == 0x3000 ||
+      codeUnit == 0xFEFF;
+}
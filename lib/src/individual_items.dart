@@ -8,11 +8,7 @@ import 'bulk_access.dart';
 CatechismItem? loadWestminsterShorterCatechismQuestion(int questionNumber) {
   final catechism = getWestminsterShorterCatechism();
 
-  try {
-    return catechism.firstWhere((qa) => qa.number == questionNumber);
-  } catch (e) {
-    return null;
-  }
+  return Catechism(catechism).getQuestion(questionNumber);
 }
 
 /// Load a specific question from the Westminster Larger Catechism by number
@@ -20,11 +16,7 @@ CatechismItem? loadWestminsterShorterCatechismQuestion(int questionNumber) {
 CatechismItem? loadWestminsterLargerCatechismQuestion(int questionNumber) {
   final catechism = getWestminsterLargerCatechism();
 
-  try {
-    return catechism.firstWhere((qa) => qa.number == questionNumber);
-  } catch (e) {
-    return null;
-  }
+  return Catechism(catechism).getQuestion(questionNumber);
 }
 
 /// Load a specific chapter from the Westminster Confession by number
@@ -32,11 +24,7 @@ CatechismItem? loadWestminsterLargerCatechismQuestion(int questionNumber) {
 ConfessionChapter? loadWestminsterConfessionChapter(int chapterNumber) {
   final confession = getWestminsterConfession();
 
-  try {
-    return confession.firstWhere((chapter) => chapter.number == chapterNumber);
-  } catch (e) {
-    return null;
-  }
+  return Confession(confession).getChapter(chapterNumber);
 }
 
 /// Lazy load a specific question from the Westminster Shorter Catechism by number
@@ -46,11 +34,7 @@ Future<CatechismItem?> loadWestminsterShorterCatechismQuestionLazy(
 ) async {
   final catechism = await loadWestminsterShorterCatechismLazy();
 
-  try {
-    return catechism.firstWhere((qa) => qa.number == questionNumber);
-  } catch (e) {
-    return null;
-  }
+  return Catechism(catechism).getQuestion(questionNumber);
 }
 
 /// Lazy load a specific question from the Westminster Larger Catechism by number
@@ -60,11 +44,7 @@ Future<CatechismItem?> loadWestminsterLargerCatechismQuestionLazy(
 ) async {
   final catechism = await loadWestminsterLargerCatechismLazy();
 
-  try {
-    return catechism.firstWhere((qa) => qa.number == questionNumber);
-  } catch (e) {
-    return null;
-  }
+  return Catechism(catechism).getQuestion(questionNumber);
 }
 
 /// Lazy load a specific chapter from the Westminster Confession by number
@@ -74,9 +54,5 @@ Future<ConfessionChapter?> loadWestminsterConfessionChapterLazy(
 ) async {
   final confession = await loadWestminsterConfessionLazy();
 
-  try {
-    return confession.firstWhere((chapter) => chapter.number == chapterNumber);
-  } catch (e) {
-    return null;
-  }
+  return Confession(confession).getChapter(chapterNumber);
 }
@@ -1,5 +1,6 @@
 import 'dart:convert';
 import 'asset_loader_interface.dart';
+import 'json_parsing.dart';
 import 'models.dart';
 
 /// Type-safe JSON file loader with dependency injection
@@ -108,43 +109,7 @@ class WestminsterJsonLoader {
       (json) => json.containsKey('chapters') && json['chapters'] is List,
     );
 
-    final chapters = data['chapters'] as List;
-    return chapters.map((chapterJson) {
-      final chapter = chapterJson as Map<String, dynamic>;
-      final sections =
-          (chapter['sections'] as List).map((sectionJson) {
-            final section = sectionJson as Map<String, dynamic>;
-            final clauses =
-                (section['clauses'] as List).map((clauseJson) {
-                  final clause = clauseJson as Map<String, dynamic>;
-                  final proofTexts =
-                      (clause['proofTexts'] as List).map((proofTextJson) {
-                        final proofText = proofTextJson as Map<String, dynamic>;
-                        return ProofText(
-                          reference: proofText['reference'] as String,
-                          text: proofText['text'] as String,
-                        );
-                      }).toList();
-
-                  return Clause(
-                    text: clause['text'] as String,
-                    proofTexts: proofTexts,
-                  );
-                }).toList();
-
-            return ConfessionSection(
-              number: section['number'] as int,
-              text: section['text'] as String,
-              clauses: clauses,
-            );
-          }).toList();
-
-      return ConfessionChapter(
-        number: chapter['number'] as int,
-        title: chapter['title'] as String,
-        sections: sections,
-      );
-    }).toList();
+    return parseConfessionChapters(data['chapters'] as List);
   }
 
   /// Load Westminster Shorter Catechism data
@@ -153,34 +118,7 @@ class WestminsterJsonLoader {
       'assets/catechisms/shorter/westminster_shorter_catechism.json',
     );
 
-    return data.map((questionJson) {
-      final question = questionJson as Map<String, dynamic>;
-      final clauses =
-          (question['clauses'] as List).map((clauseJson) {
-            final clause = clauseJson as Map<String, dynamic>;
-            final proofTexts =
-                (clause['references'] as List).map((proofTextJson) {
-                  final proofText = proofTextJson as Map<String, dynamic>;
-                  return ProofText(
-                    reference: proofText['reference'] as String,
-                    text: proofText['text'] as String,
-                  );
-                }).toList();
-
-            return Clause(
-              text: clause['text'] as String,
-              proofTexts: proofTexts,
-              footnoteNum: clause['footnote'] as int?,
-            );
-          }).toList();
-
-      return CatechismItem(
-        number: question['number'] as int,
-        question: question['question'] as String,
-        answer: question['answer'] as String,
-        clauses: clauses,
-      );
-    }).toList();
+    return parseCatechismItems(data);
   }
 
   /// Load Westminster Larger Catechism data
@@ -189,34 +127,7 @@ class WestminsterJsonLoader {
       'assets/catechisms/larger/westminster_larger_catechism_with_references.json',
     );
 
-    return data.map((questionJson) {
-      final question = questionJson as Map<String, dynamic>;
-      final clauses =
-          (question['clauses'] as List).map((clauseJson) {
-            final clause = clauseJson as Map<String, dynamic>;
-            final proofTexts =
-                (clause['references'] as List).map((proofTextJson) {
-                  final proofText = proofTextJson as Map<String, dynamic>;
-                  return ProofText(
-                    reference: proofText['reference'] as String,
-                    text: proofText['text'] as String,
-                  );
-                }).toList();
-
-            return Clause(
-              text: clause['text'] as String,
-              proofTexts: proofTexts,
-              footnoteNum: clause['footnote'] as int?,
-            );
-          }).toList();
-
-      return CatechismItem(
-        number: question['number'] as int,
-        question: question['question'] as String,
-        answer: question['answer'] as String,
-        clauses: clauses,
-      );
-    }).toList();
+    return parseCatechismItems(data);
   }
 
   /// Get the underlying JsonFileLoader for advanced operations
@@ -0,0 +1,89 @@
+import 'models/catechism_qa.dart';
+import 'models/clause.dart';
+import 'models/confession_chapter.dart';
+import 'models/confession_section.dart';
+import 'models/proof_text.dart';
+
+/// Parse the decoded `chapters` list of the Westminster Confession
+///
+/// Identical proof texts are shared between clauses rather than duplicated
+List<ConfessionChapter> parseConfessionChapters(List<dynamic> chapters) {
+  final proofTexts = _ProofTextPool();
+
+  return chapters.map((chapterJson) {
+    final chapter = chapterJson as Map<String, dynamic>;
+    final sections =
+        (chapter['sections'] as List).map((sectionJson) {
+          final section = sectionJson as Map<String, dynamic>;
+          final clauses =
+              (section['clauses'] as List).map((clauseJson) {
+                final clause = clauseJson as Map<String, dynamic>;
+                return Clause(
+                  text: clause['text'] as String,
+                  proofTexts: proofTexts.parseAll(
+                    clause['proofTexts'] as List,
+                  ),
+                );
+              }).toList();
+
+          return ConfessionSection(
+            number: section['number'] as int,
+            text: section['text'] as String,
+            clauses: clauses,
+          );
+        }).toList();
+
+    return ConfessionChapter(
+      number: chapter['number'] as int,
+      title: chapter['title'] as String,
+      sections: sections,
+    );
+  }).toList();
+}
+
+/// Parse the decoded question list of a Westminster catechism
+///
+/// Identical proof texts are shared between clauses rather than duplicated
+List<CatechismItem> parseCatechismItems(List<dynamic> questions) {
+  final proofTexts = _ProofTextPool();
+
+  return questions.map((questionJson) {
+    final question = questionJson as Map<String, dynamic>;
+    final clauses =
+        (question['clauses'] as List).map((clauseJson) {
+          final clause = clauseJson as Map<String, dynamic>;
+          return Clause(
+            text: clause['text'] as String,
+            proofTexts: proofTexts.parseAll(clause['references'] as List),
+            footnoteNum: clause['footnote'] as int?,
+          );
+        }).toList();
+
+    return CatechismItem(
+      number: question['number'] as int,
+      question: question['question'] as String,
+      answer: question['answer'] as String,
+      clauses: clauses,
+    );
+  }).toList();
+}
+
+/// Canonical proof text instances for a single document
+///
+/// The same scripture reference is cited from many clauses, so each distinct
+/// reference and text pair is kept as one object
+class _ProofTextPool {
+  final Map<(String, String), ProofText> _proofTexts = {};
+
+  List<ProofText> parseAll(List<dynamic> proofTextsJson) {
+    return proofTextsJson.map((proofTextJson) {
+      final proofText = proofTextJson as Map<String, dynamic>;
+      final reference = proofText['reference'] as String;
+      final text = proofText['text'] as String;
+      return _proofTexts.putIfAbsent(
+        (reference, text),
+        () => ProofText(reference: reference, text: text),
+      );
+    }).toList();
+  }
+}
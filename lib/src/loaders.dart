@@ -1,14 +1,15 @@
 import 'dart:convert';
 import 'dart:io';
 import 'package:path/path.dart' as path;
+import 'json_parsing.dart';
 import 'models/catechism_qa.dart';
 import 'models/confession_chapter.dart';
-import 'models/proof_text.dart';
-import 'models/clause.dart';
-import 'models/confession_section.dart';
+
+/// Decodes JSON straight from UTF-8 bytes without building an intermediate String
+final _utf8JsonDecoder = utf8.decoder.fuse(json.decoder);
 
 /// Try to find and load a file from multiple possible locations
-Future<String> _loadAssetFile(String relativePath) async {
+Future<List<int>> _loadAssetFile(String relativePath) async {
   final possiblePaths = [
     // Current working directory (for development)
     relativePath,
@@ -40,7 +41,7 @@ Future<String> _loadAssetFile(String relativePath) async {
   for (final filePath in possiblePaths) {
     final file = File(filePath);
     if (await file.exists()) {
-      return await file.readAsString();
+      return await file.readAsBytes();
     }
   }
 
@@ -54,137 +55,40 @@ Future<String> _loadAssetFile(String relativePath) async {
 
 /// Load the Westminster Confession as JSON
 Future<Map<String, dynamic>> loadWestminsterConfessionJson() async {
-  final jsonString = await _loadAssetFile(
-    'confession/westminster_confession.json',
-  );
-  return json.decode(jsonString) as Map<String, dynamic>;
+  final bytes = await _loadAssetFile('confession/westminster_confession.json');
+  return _utf8JsonDecoder.convert(bytes) as Map<String, dynamic>;
 }
 
 /// Load the Westminster Shorter Catechism as JSON
 Future<List<dynamic>> loadWestminsterShorterCatechismJson() async {
-  final jsonString = await _loadAssetFile(
+  final bytes = await _loadAssetFile(
     'catechisms/shorter/westminster_shorter_catechism.json',
   );
-  return json.decode(jsonString) as List<dynamic>;
+  return _utf8JsonDecoder.convert(bytes) as List<dynamic>;
 }
 
 /// Load the Westminster Larger Catechism as JSON
 Future<List<dynamic>> loadWestminsterLargerCatechismJson() async {
-  final jsonString = await _loadAssetFile(
+  final bytes = await _loadAssetFile(
     'catechisms/larger/westminster_larger_catechism_with_references.json',
   );
-  return json.decode(jsonString) as List<dynamic>;
+  return _utf8JsonDecoder.convert(bytes) as List<dynamic>;
 }
 
 /// Load the Westminster Confession as Dart objects
 Future<List<ConfessionChapter>> loadWestminsterConfession() async {
   final json = await loadWestminsterConfessionJson();
-  final chapters = json['chapters'] as List;
-
-  return chapters.map((chapterJson) {
-    final chapter = chapterJson as Map<String, dynamic>;
-    final sections =
-        (chapter['sections'] as List).map((sectionJson) {
-          final section = sectionJson as Map<String, dynamic>;
-          final clauses =
-              (section['clauses'] as List).map((clauseJson) {
-                final clause = clauseJson as Map<String, dynamic>;
-                final proofTexts =
-                    (clause['proofTexts'] as List).map((proofTextJson) {
-                      final proofText = proofTextJson as Map<String, dynamic>;
-                      return ProofText(
-                        reference: proofText['reference'] as String,
-                        text: proofText['text'] as String,
-                      );
-                    }).toList();
-
-                return Clause(
-                  text: clause['text'] as String,
-                  proofTexts: proofTexts,
-                );
-              }).toList();
-
-          return ConfessionSection(
-            number: section['number'] as int,
-            text: section['text'] as String,
-            clauses: clauses,
-          );
-        }).toList();
-
-    return ConfessionChapter(
-      number: chapter['number'] as int,
-      title: chapter['title'] as String,
-      sections: sections,
-    );
-  }).toList();
+  return parseConfessionChapters(json['chapters'] as List);
 }
 
 /// Load the Westminster Shorter Catechism as Dart objects
 Future<List<CatechismItem>> loadWestminsterShorterCatechism() async {
   final json = await loadWestminsterShorterCatechismJson();
-  final questions = json as List;
-
-  return questions.map((questionJson) {
-    final question = questionJson as Map<String, dynamic>;
-    final clauses =
-        (question['clauses'] as List).map((clauseJson) {
-          final clause = clauseJson as Map<String, dynamic>;
-          final proofTexts =
-              (clause['references'] as List).map((proofTextJson) {
-                final proofText = proofTextJson as Map<String, dynamic>;
-                return ProofText(
-                  reference: proofText['reference'] as String,
-                  text: proofText['text'] as String,
-                );
-              }).toList();
-
-          return Clause(
-            text: clause['text'] as String,
-            proofTexts: proofTexts,
-            footnoteNum: clause['footnote'] as int?,
-          );
-        }).toList();
-
-    return CatechismItem(
-      number: question['number'] as int,
-      question: question['question'] as String,
-      answer: question['answer'] as String,
-      clauses: clauses,
-    );
-  }).toList();
+  return parseCatechismItems(json);
 }
 
 /// Load the Westminster Larger Catechism as Dart objects
 Future<List<CatechismItem>> loadWestminsterLargerCatechism() async {
   final json = await loadWestminsterLargerCatechismJson();
-  final questions = json as List;
-
-  return questions.map((questionJson) {
-    final question = questionJson as Map<String, dynamic>;
-    final clauses =
-        (question['clauses'] as List).map((clauseJson) {
-          final clause = clauseJson as Map<String, dynamic>;
-          final proofTexts =
-              (clause['references'] as List).map((proofTextJson) {
-                final proofText = proofTextJson as Map<String, dynamic>;
-                return ProofText(
-                  reference: proofText['reference'] as String,
-                  text: proofText['text'] as String,
-                );
-              }).toList();
-
-          return Clause(
-            text: clause['text'] as String,
-            proofTexts: proofTexts,
-            footnoteNum: clause['footnote'] as int?,
-          );
-        }).toList();
-
-    return CatechismItem(
-      number: question['number'] as int,
-      question: question['question'] as String,
-      answer: question['answer'] as String,
-      clauses: clauses,
-    );
-  }).toList();
+  return parseCatechismItems(json);
 }
@@ -1,5 +1,6 @@
 import 'catechism_qa.dart';
 import '../types.dart';
+import '../search_matching.dart';
 
 /// Enhanced access to catechism data with search and filtering capabilities
 class Catechism {
@@ -12,11 +13,18 @@ class Catechism {
 
   /// Get a specific question by number
   CatechismItem? getQuestion(int number) {
-    try {
-      return _questions.firstWhere((qa) => qa.number == number);
-    } catch (e) {
-      return null;
+    // Questions are stored in order, so check the expected slot first
+    final index = number - 1;
+    if (index >= 0 && index < _questions.length) {
+      final candidate = _questions[index];
+      if (candidate.number == number) return candidate;
     }
+
+    // Fall back to a scan if the questions are not numbered from 1 in order
+    for (final qa in _questions) {
+      if (qa.number == number) return qa;
+    }
+    return null;
   }
 
   /// Get the first question
@@ -35,42 +43,7 @@ class Catechism {
     String searchString, [
     CatechismItemPart part = CatechismItemPart.all,
   ]) {
-    final lowerSearch = searchString.toLowerCase();
-    return _questions.where((qa) {
-      switch (part) {
-        case CatechismItemPart.question:
-          return qa.question.toLowerCase().contains(lowerSearch);
-        case CatechismItemPart.answer:
-          return qa.answer.toLowerCase().contains(lowerSearch);
-        case CatechismItemPart.references:
-          return qa.allProofTexts.any(
-            (proofText) =>
-                proofText.reference.toLowerCase().contains(lowerSearch),
-          );
-        case CatechismItemPart.questionAndAnswer:
-          return qa.question.toLowerCase().contains(lowerSearch) ||
-              qa.answer.toLowerCase().contains(lowerSearch);
-        case CatechismItemPart.questionAndReferences:
-          return qa.question.toLowerCase().contains(lowerSearch) ||
-              qa.allProofTexts.any(
-                (proofText) =>
-                    proofText.reference.toLowerCase().contains(lowerSearch),
-              );
-        case CatechismItemPart.answerAndReferences:
-          return qa.answer.toLowerCase().contains(lowerSearch) ||
-              qa.allProofTexts.any(
-                (proofText) =>
-                    proofText.reference.toLowerCase().contains(lowerSearch),
-              );
-        case CatechismItemPart.all:
-          return qa.question.toLowerCase().contains(lowerSearch) ||
-              qa.answer.toLowerCase().contains(lowerSearch) ||
-              qa.allProofTexts.any(
-                (proofText) =>
-                    proofText.reference.toLowerCase().contains(lowerSearch),
-              );
-      }
-    }).toList();
+    return _questions.where(catechismItemMatcher(searchString, part)).toList();
   }
 
   /// Find questions where the question contains the exact string
@@ -119,14 +92,13 @@ class Catechism {
 
   /// Get questions within a range (inclusive)
   List<CatechismItem> range(int start, int end) {
-    return _questions
-        .where((qa) => qa.number >= start && qa.number <= end)
-        .toList();
+    return _inRange(start, end).toList();
   }
 
   /// Get questions by multiple numbers
   List<CatechismItem> byNumbers(List<int> numbers) {
-    return _questions.where((qa) => numbers.contains(qa.number)).toList();
+    final numberSet = numbers.toSet();
+    return _questions.where((qa) => numberSet.contains(qa.number)).toList();
   }
 
   /// Search within a range of questions
@@ -142,10 +114,7 @@ class Catechism {
     CatechismItemPart part = CatechismItemPart.all,
   ]) {
     // First filter by range
-    final rangeQuestions =
-        _questions
-            .where((qa) => qa.number >= start && qa.number <= end)
-            .toList();
+    final rangeQuestions = _inRange(start, end);
 
     // Then apply search filter
     return _filterBySearch(rangeQuestions, searchString, part);
@@ -163,56 +132,37 @@ class Catechism {
     CatechismItemPart part = CatechismItemPart.all,
   ]) {
     // First filter by numbers
-    final specificQuestions =
-        _questions.where((qa) => numbers.contains(qa.number)).toList();
+    final numberSet = numbers.toSet();
+    final specificQuestions = _questions.where(
+      (qa) => numberSet.contains(qa.number),
+    );
 
     // Then apply search filter
     return _filterBySearch(specificQuestions, searchString, part);
   }
 
+  /// Helper function to select the questions within a range (inclusive)
+  Iterable<CatechismItem> _inRange(int start, int end) {
+    // Questions are stored in order, so slice the range directly when every
+    // slot in it holds the expected number
+    final first = start < 1 ? 1 : start;
+    final last = end < _questions.length ? end : _questions.length;
+    var isAligned = first <= last;
+    for (var number = first; isAligned && number <= last; number++) {
+      isAligned = _questions[number - 1].number == number;
+    }
+    if (isAligned) return _questions.getRange(first - 1, last);
+
+    return _questions.where((qa) => qa.number >= start && qa.number <= end);
+  }
+
   /// Helper function to filter questions by search criteria
   List<CatechismItem> _filterBySearch(
-    List<CatechismItem> questions,
+    Iterable<CatechismItem> questions,
     String searchString,
     CatechismItemPart part,
   ) {
-    final lowerSearch = searchString.toLowerCase();
-
-    return questions.where((qa) {
-      switch (part) {
-        case CatechismItemPart.question:
-          return qa.question.toLowerCase().contains(lowerSearch);
-        case CatechismItemPart.answer:
-          return qa.answer.toLowerCase().contains(lowerSearch);
-        case CatechismItemPart.references:
-          return qa.allProofTexts.any(
-            (proofText) =>
-                proofText.reference.toLowerCase().contains(lowerSearch),
-          );
-        case CatechismItemPart.questionAndAnswer:
-          return qa.question.toLowerCase().contains(lowerSearch) ||
-              qa.answer.toLowerCase().contains(lowerSearch);
-        case CatechismItemPart.questionAndReferences:
-          return qa.question.toLowerCase().contains(lowerSearch) ||
-              qa.allProofTexts.any(
-                (proofText) =>
-                    proofText.reference.toLowerCase().contains(lowerSearch),
-              );
-        case CatechismItemPart.answerAndReferences:
-          return qa.answer.toLowerCase().contains(lowerSearch) ||
-              qa.allProofTexts.any(
-                (proofText) =>
-                    proofText.reference.toLowerCase().contains(lowerSearch),
-              );
-        case CatechismItemPart.all:
-          return qa.question.toLowerCase().contains(lowerSearch) ||
-              qa.answer.toLowerCase().contains(lowerSearch) ||
-              qa.allProofTexts.any(
-                (proofText) =>
-                    proofText.reference.toLowerCase().contains(lowerSearch),
-              );
-      }
-    }).toList();
+    return questions.where(catechismItemMatcher(searchString, part)).toList();
   }
 
   /// Get all proof texts from all questions
@@ -249,10 +199,7 @@ class Catechism {
   String getRangeTextOnly(int start, int end) {
     if (_questions.isEmpty) return '';
 
-    final rangeQuestions =
-        _questions
-            .where((qa) => qa.number >= start && qa.number <= end)
-            .toList();
+    final rangeQuestions = _inRange(start, end);
 
     return rangeQuestions
         .map((qa) {
@@ -265,8 +212,10 @@ class Catechism {
   String getByNumbersTextOnly(List<int> numbers) {
     if (_questions.isEmpty) return '';
 
-    final specificQuestions =
-        _questions.where((qa) => numbers.contains(qa.number)).toList();
+    final numberSet = numbers.toSet();
+    final specificQuestions = _questions.where(
+      (qa) => numberSet.contains(qa.number),
+    );
 
     return specificQuestions
         .map((qa) {
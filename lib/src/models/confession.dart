@@ -12,11 +12,18 @@ class Confession {
 
   /// Get a specific chapter by number
   ConfessionChapter? getChapter(int number) {
-    try {
-      return _chapters.firstWhere((chapter) => chapter.number == number);
-    } catch (e) {
-      return null;
+    // Chapters are stored in order, so check the expected slot first
+    final index = number - 1;
+    if (index >= 0 && index < _chapters.length) {
+      final candidate = _chapters[index];
+      if (candidate.number == number) return candidate;
     }
+
+    // Fall back to a scan if the chapters are not numbered from 1 in order
+    for (final chapter in _chapters) {
+      if (chapter.number == number) return chapter;
+    }
+    return null;
   }
 
   /// Get the first chapter
@@ -87,15 +94,14 @@ class Confession {
 
   /// Get chapters within a range (inclusive)
   List<ConfessionChapter> range(int start, int end) {
-    return _chapters
-        .where((chapter) => chapter.number >= start && chapter.number <= end)
-        .toList();
+    return _inRange(start, end).toList();
   }
 
   /// Get chapters by multiple numbers
   List<ConfessionChapter> byNumbers(List<int> numbers) {
+    final numberSet = numbers.toSet();
     return _chapters
-        .where((chapter) => numbers.contains(chapter.number))
+        .where((chapter) => numberSet.contains(chapter.number))
         .toList();
   }
 
@@ -114,12 +120,7 @@ class Confession {
     bool searchInContent = true,
   }) {
     // First filter by range
-    final rangeChapters =
-        _chapters
-            .where(
-              (chapter) => chapter.number >= start && chapter.number <= end,
-            )
-            .toList();
+    final rangeChapters = _inRange(start, end);
 
     // Then apply search filter
     return _filterBySearch(
@@ -144,8 +145,10 @@ class Confession {
     bool searchInContent = true,
   }) {
     // First filter by numbers
-    final specificChapters =
-        _chapters.where((chapter) => numbers.contains(chapter.number)).toList();
+    final numberSet = numbers.toSet();
+    final specificChapters = _chapters.where(
+      (chapter) => numberSet.contains(chapter.number),
+    );
 
     // Then apply search filter
     return _filterBySearch(
@@ -156,9 +159,26 @@ class Confession {
     );
   }
 
+  /// Helper function to select the chapters within a range (inclusive)
+  Iterable<ConfessionChapter> _inRange(int start, int end) {
+    // Chapters are stored in order, so slice the range directly when every
+    // slot in it holds the expected number
+    final first = start < 1 ? 1 : start;
+    final last = end < _chapters.length ? end : _chapters.length;
+    var isAligned = first <= last;
+    for (var number = first; isAligned && number <= last; number++) {
+      isAligned = _chapters[number - 1].number == number;
+    }
+    if (isAligned) return _chapters.getRange(first - 1, last);
+
+    return _chapters.where(
+      (chapter) => chapter.number >= start && chapter.number <= end,
+    );
+  }
+
   /// Helper function to filter chapters by search criteria
   List<ConfessionChapter> _filterBySearch(
-    List<ConfessionChapter> chapters,
+    Iterable<ConfessionChapter> chapters,
     String searchString, {
     bool searchInTitle = true,
     bool searchInContent = true,
@@ -218,72 +238,39 @@ class Confession {
   // Text-only access methods (excluding scripture references)
 
   /// Get the full text content of the confession (excluding scripture references)
-  String get textOnly {
-    if (_chapters.isEmpty) return '';
-
-    return _chapters
-        .map((chapter) {
-          final chapterText = StringBuffer();
-          chapterText.writeln('Chapter ${chapter.number}. ${chapter.title}');
-          chapterText.writeln();
-
-          for (final section in chapter.sections) {
-            chapterText.writeln('${section.number}. ${section.text}');
-            chapterText.writeln();
-          }
-
-          return chapterText.toString();
-        })
-        .join('\n');
-  }
+  String get textOnly => _writeTextOnly(_chapters);
 
   /// Get text content of a range of chapters (excluding scripture references)
   String getRangeTextOnly(int start, int end) {
-    if (_chapters.isEmpty) return '';
-
-    final rangeChapters =
-        _chapters
-            .where(
-              (chapter) => chapter.number >= start && chapter.number <= end,
-            )
-            .toList();
-
-    return rangeChapters
-        .map((chapter) {
-          final chapterText = StringBuffer();
-          chapterText.writeln('Chapter ${chapter.number}. ${chapter.title}');
-          chapterText.writeln();
-
-          for (final section in chapter.sections) {
-            chapterText.writeln('${section.number}. ${section.text}');
-            chapterText.writeln();
-          }
-
-          return chapterText.toString();
-        })
-        .join('\n');
+    return _writeTextOnly(_inRange(start, end));
   }
 
   /// Get text content of specific chapters by numbers (excluding scripture references)
   String getByNumbersTextOnly(List<int> numbers) {
-    if (_chapters.isEmpty) return '';
+    final numberSet = numbers.toSet();
+    return _writeTextOnly(
+      _chapters.where((chapter) => numberSet.contains(chapter.number)),
+    );
+  }
+
+  /// Helper function to write the text of chapters into a single buffer
+  String _writeTextOnly(Iterable<ConfessionChapter> chapters) {
+    final buffer = StringBuffer();
+    var isFirst = true;
 
-    final specificChapters =
-        _chapters.where((chapter) => numbers.contains(chapter.number)).toList();
+    for (final chapter in chapters) {
+      if (!isFirst) buffer.writeln();
+      isFirst = false;
 
-    return specificChapters
-        .map((chapter) {
-          final chapterText = StringBuffer();
-          chapterText.writeln('Chapter ${chapter.number}. ${chapter.title}');
-          chapterText.writeln();
+      buffer.writeln('Chapter ${chapter.number}. ${chapter.title}');
+      buffer.writeln();
 
-          for (final section in chapter.sections) {
-            chapterText.writeln('${section.number}. ${section.text}');
-            chapterText.writeln();
-          }
+      for (final section in chapter.sections) {
+        buffer.writeln('${section.number}. ${section.text}');
+        buffer.writeln();
+      }
+    }
 
-          return chapterText.toString();
-        })
-        .join('\n');
+    return buffer.toString();
   }
 }
@@ -11,9 +11,7 @@ List<CatechismItem> getWestminsterShorterCatechismRange(int start, int end) {
 
   if (catechism.isEmpty) return [];
 
-  return catechism
-      .where((qa) => qa.number >= start && qa.number <= end)
-      .toList();
+  return Catechism(catechism).range(start, end);
 }
 
 /// Get a range of questions from the Westminster Larger Catechism (inclusive)
@@ -24,9 +22,7 @@ List<CatechismItem> getWestminsterLargerCatechismRange(int start, int end) {
 
   if (catechism.isEmpty) return [];
 
-  return catechism
-      .where((qa) => qa.number >= start && qa.number <= end)
-      .toList();
+  return Catechism(catechism).range(start, end);
 }
 
 /// Get a range of chapters from the Westminster Confession (inclusive)
@@ -37,9 +33,7 @@ List<ConfessionChapter> getWestminsterConfessionRange(int start, int end) {
 
   if (confession.isEmpty) return [];
 
-  return confession
-      .where((chapter) => chapter.number >= start && chapter.number <= end)
-      .toList();
+  return Confession(confession).range(start, end);
 }
 
 /// Get specific questions by numbers from the Westminster Shorter Catechism
@@ -50,7 +44,8 @@ List<CatechismItem> getWestminsterShorterCatechismByNumbers(List<int> numbers) {
 
   if (catechism.isEmpty) return [];
 
-  return catechism.where((qa) => numbers.contains(qa.number)).toList();
+  final numberSet = numbers.toSet();
+  return catechism.where((qa) => numberSet.contains(qa.number)).toList();
 }
 
 /// Get specific questions by numbers from the Westminster Larger Catechism
@@ -61,7 +56,8 @@ List<CatechismItem> getWestminsterLargerCatechismByNumbers(List<int> numbers) {
 
   if (catechism.isEmpty) return [];
 
-  return catechism.where((qa) => numbers.contains(qa.number)).toList();
+  final numberSet = numbers.toSet();
+  return catechism.where((qa) => numberSet.contains(qa.number)).toList();
 }
 
 /// Get specific chapters by numbers from the Westminster Confession
@@ -72,8 +68,9 @@ List<ConfessionChapter> getWestminsterConfessionByNumbers(List<int> numbers) {
 
   if (confession.isEmpty) return [];
 
+  final numberSet = numbers.toSet();
   return confession
-      .where((chapter) => numbers.contains(chapter.number))
+      .where((chapter) => numberSet.contains(chapter.number))
       .toList();
 }
 
@@ -87,9 +84,7 @@ Future<List<CatechismItem>> loadWestminsterShorterCatechismRangeLazy(
 
   if (catechism.isEmpty) return [];
 
-  return catechism
-      .where((qa) => qa.number >= start && qa.number <= end)
-      .toList();
+  return Catechism(catechism).range(start, end);
 }
 
 /// Lazy load a range of questions from the Westminster Larger Catechism (inclusive)
@@ -102,9 +97,7 @@ Future<List<CatechismItem>> loadWestminsterLargerCatechismRangeLazy(
 
   if (catechism.isEmpty) return [];
 
-  return catechism
-      .where((qa) => qa.number >= start && qa.number <= end)
-      .toList();
+  return Catechism(catechism).range(start, end);
 }
 
 /// Lazy load a range of chapters from the Westminster Confession (inclusive)
@@ -117,9 +110,7 @@ Future<List<ConfessionChapter>> loadWestminsterConfessionRangeLazy(
 
   if (confession.isEmpty) return [];
 
-  return confession
-      .where((chapter) => chapter.number >= start && chapter.number <= end)
-      .toList();
+  return Confession(confession).range(start, end);
 }
 
 /// Lazy load specific questions by numbers from the Westminster Shorter Catechism
@@ -131,7 +122,8 @@ Future<List<CatechismItem>> loadWestminsterShorterCatechismByNumbersLazy(
 
   if (catechism.isEmpty) return [];
 
-  return catechism.where((qa) => numbers.contains(qa.number)).toList();
+  final numberSet = numbers.toSet();
+  return catechism.where((qa) => numberSet.contains(qa.number)).toList();
 }
 
 /// Lazy load specific questions by numbers from the Westminster Larger Catechism
@@ -143,7 +135,8 @@ Future<List<CatechismItem>> loadWestminsterLargerCatechismByNumbersLazy(
 
   if (catechism.isEmpty) return [];
 
-  return catechism.where((qa) => numbers.contains(qa.number)).toList();
+  final numberSet = numbers.toSet();
+  return catechism.where((qa) => numberSet.contains(qa.number)).toList();
 }
 
 /// Lazy load specific chapters by numbers from the Westminster Confession
@@ -155,7 +148,8 @@ Future<List<ConfessionChapter>> loadWestminsterConfessionByNumbersLazy(
 
   if (confession.isEmpty) return [];
 
+  final numberSet = numbers.toSet();
   return confession
-      .where((chapter) => numbers.contains(chapter.number))
+      .where((chapter) => numberSet.contains(chapter.number))
       .toList();
 }
@@ -19,12 +19,7 @@ List<CatechismItem> searchWestminsterShorterCatechismRange(
 
   if (catechism.isEmpty) return [];
 
-  // First filter by range
-  final rangeQuestions =
-      catechism.where((qa) => qa.number >= start && qa.number <= end).toList();
-
-  // Then apply search filter
-  return _filterCatechismBySearch(rangeQuestions, searchString, part);
+  return Catechism(catechism).searchRange(start, end, searchString, part);
 }
 
 /// Search within a range of Larger Catechism questions
@@ -43,12 +38,7 @@ List<CatechismItem> searchWestminsterLargerCatechismRange(
 
   if (catechism.isEmpty) return [];
 
-  // First filter by range
-  final rangeQuestions =
-      catechism.where((qa) => qa.number >= start && qa.number <= end).toList();
-
-  // Then apply search filter
-  return _filterCatechismBySearch(rangeQuestions, searchString, part);
+  return Catechism(catechism).searchRange(start, end, searchString, part);
 }
 
 /// Search within a range of Confession chapters
@@ -69,15 +59,9 @@ List<ConfessionChapter> searchWestminsterConfessionRange(
 
   if (confession.isEmpty) return [];
 
-  // First filter by range
-  final rangeChapters =
-      confession
-          .where((chapter) => chapter.number >= start && chapter.number <= end)
-          .toList();
-
-  // Then apply search filter
-  return _filterConfessionBySearch(
-    rangeChapters,
+  return Confession(confession).searchRange(
+    start,
+    end,
     searchString,
     searchInTitle: searchInTitle,
     searchInContent: searchInContent,
@@ -99,12 +83,7 @@ List<CatechismItem> searchWestminsterShorterCatechismByNumbers(
 
   if (catechism.isEmpty) return [];
 
-  // First filter by numbers
-  final specificQuestions =
-      catechism.where((qa) => numbers.contains(qa.number)).toList();
-
-  // Then apply search filter
-  return _filterCatechismBySearch(specificQuestions, searchString, part);
+  return Catechism(catechism).searchByNumbers(numbers, searchString, part);
 }
 
 /// Search within specific Larger Catechism questions by numbers
@@ -122,12 +101,7 @@ List<CatechismItem> searchWestminsterLargerCatechismByNumbers(
 
   if (catechism.isEmpty) return [];
 
-  // First filter by numbers
-  final specificQuestions =
-      catechism.where((qa) => numbers.contains(qa.number)).toList();
-
-  // Then apply search filter
-  return _filterCatechismBySearch(specificQuestions, searchString, part);
+  return Catechism(catechism).searchByNumbers(numbers, searchString, part);
 }
 
 /// Search within specific Confession chapters by numbers
@@ -147,13 +121,8 @@ List<ConfessionChapter> searchWestminsterConfessionByNumbers(
 
   if (confession.isEmpty) return [];
 
-  // First filter by numbers
-  final specificChapters =
-      confession.where((chapter) => numbers.contains(chapter.number)).toList();
-
-  // Then apply search filter
-  return _filterConfessionBySearch(
-    specificChapters,
+  return Confession(confession).searchByNumbers(
+    numbers,
     searchString,
     searchInTitle: searchInTitle,
     searchInContent: searchInContent,
@@ -174,12 +143,7 @@ Future<List<CatechismItem>> searchWestminsterShorterCatechismRangeLazy(
 
   if (catechism.isEmpty) return [];
 
-  // First filter by range
-  final rangeQuestions =
-      catechism.where((qa) => qa.number >= start && qa.number <= end).toList();
-
-  // Then apply search filter
-  return _filterCatechismBySearch(rangeQuestions, searchString, part);
+  return Catechism(catechism).searchRange(start, end, searchString, part);
 }
 
 /// Lazy search within a range of Larger Catechism questions
@@ -193,12 +157,7 @@ Future<List<CatechismItem>> searchWestminsterLargerCatechismRangeLazy(
 
   if (catechism.isEmpty) return [];
 
-  // First filter by range
-  final rangeQuestions =
-      catechism.where((qa) => qa.number >= start && qa.number <= end).toList();
-
-  // Then apply search filter
-  return _filterCatechismBySearch(rangeQuestions, searchString, part);
+  return Catechism(catechism).searchRange(start, end, searchString, part);
 }
 
 /// Lazy search within a range of Confession chapters
@@ -213,15 +172,9 @@ Future<List<ConfessionChapter>> searchWestminsterConfessionRangeLazy(
 
   if (confession.isEmpty) return [];
 
-  // First filter by range
-  final rangeChapters =
-      confession
-          .where((chapter) => chapter.number >= start && chapter.number <= end)
-          .toList();
-
-  // Then apply search filter
-  return _filterConfessionBySearch(
-    rangeChapters,
+  return Confession(confession).searchRange(
+    start,
+    end,
     searchString,
     searchInTitle: searchInTitle,
     searchInContent: searchInContent,
@@ -238,12 +191,7 @@ Future<List<CatechismItem>> searchWestminsterShorterCatechismByNumbersLazy(
 
   if (catechism.isEmpty) return [];
 
-  // First filter by numbers
-  final specificQuestions =
-      catechism.where((qa) => numbers.contains(qa.number)).toList();
-
-  // Then apply search filter
-  return _filterCatechismBySearch(specificQuestions, searchString, part);
+  return Catechism(catechism).searchByNumbers(numbers, searchString, part);
 }
 
 /// Lazy search within specific Larger Catechism questions by numbers
@@ -256,12 +204,7 @@ Future<List<CatechismItem>> searchWestminsterLargerCatechismByNumbersLazy(
 
   if (catechism.isEmpty) return [];
 
-  // First filter by numbers
-  final specificQuestions =
-      catechism.where((qa) => numbers.contains(qa.number)).toList();
-
-  // Then apply search filter
-  return _filterCatechismBySearch(specificQuestions, searchString, part);
+  return Catechism(catechism).searchByNumbers(numbers, searchString, part);
 }
 
 /// Lazy search within specific Confession chapters by numbers
@@ -275,86 +218,10 @@ Future<List<ConfessionChapter>> searchWestminsterConfessionByNumbersLazy(
 
   if (confession.isEmpty) return [];
 
-  // First filter by numbers
-  final specificChapters =
-      confession.where((chapter) => numbers.contains(chapter.number)).toList();
-
-  // Then apply search filter
-  return _filterConfessionBySearch(
-    specificChapters,
+  return Confession(confession).searchByNumbers(
+    numbers,
     searchString,
     searchInTitle: searchInTitle,
     searchInContent: searchInContent,
   );
 }
-
-/// Helper function to filter catechism questions by search criteria
-List<CatechismItem> _filterCatechismBySearch(
-  List<CatechismItem> questions,
-  String searchString,
-  CatechismItemPart part,
-) {
-  final lowerSearch = searchString.toLowerCase();
-
-  return questions.where((qa) {
-    switch (part) {
-      case CatechismItemPart.question:
-        return qa.question.toLowerCase().contains(lowerSearch);
-      case CatechismItemPart.answer:
-        return qa.answer.toLowerCase().contains(lowerSearch);
-      case CatechismItemPart.references:
-        return qa.allProofTexts.any(
-          (proofText) =>
-              proofText.reference.toLowerCase().contains(lowerSearch),
-        );
-      case CatechismItemPart.questionAndAnswer:
-        return qa.question.toLowerCase().contains(lowerSearch) ||
-            qa.answer.toLowerCase().contains(lowerSearch);
-      case CatechismItemPart.questionAndReferences:
-        return qa.question.toLowerCase().contains(lowerSearch) ||
-            qa.allProofTexts.any(
-              (proofText) =>
-                  proofText.reference.toLowerCase().contains(lowerSearch),
-            );
-      case CatechismItemPart.answerAndReferences:
-        return qa.answer.toLowerCase().contains(lowerSearch) ||
-            qa.allProofTexts.any(
-              (proofText) =>
-                  proofText.reference.toLowerCase().contains(lowerSearch),
-            );
-      case CatechismItemPart.all:
-        return qa.question.toLowerCase().contains(lowerSearch) ||
-            qa.answer.toLowerCase().contains(lowerSearch) ||
-            qa.allProofTexts.any(
-              (proofText) =>
-                  proofText.reference.toLowerCase().contains(lowerSearch),
-            );
-    }
-  }).toList();
-}
-
-/// Helper function to filter confession chapters by search criteria
-List<ConfessionChapter> _filterConfessionBySearch(
-  List<ConfessionChapter> chapters,
-  String searchString, {
-  bool searchInTitle = true,
-  bool searchInContent = true,
-}) {
-  final lowerSearch = searchString.toLowerCase();
-
-  return chapters.where((chapter) {
-    // Check title if enabled
-    if (searchInTitle && chapter.title.toLowerCase().contains(lowerSearch)) {
-      return true;
-    }
-
-    // Check content if enabled
-    if (searchInContent) {
-      return chapter.sections.any((section) {
-        return section.text.toLowerCase().contains(lowerSearch);
-      });
-    }
-
-    return false;
-  }).toList();
-}
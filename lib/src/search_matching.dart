@@ -0,0 +1,41 @@
+import 'models/catechism_qa.dart';
+import 'types.dart';
+
+/// Build a predicate that matches catechism items against a search string
+///
+/// [searchString] is compared case-insensitively
+/// [part] specifies which part of the question to search in
+/// The parts to check are resolved once here, so the returned predicate only
+/// does the string comparisons for each item
+bool Function(CatechismItem) catechismItemMatcher(
+  String searchString,
+  CatechismItemPart part,
+) {
+  final lowerSearch = searchString.toLowerCase();
+  final inQuestion =
+      part == CatechismItemPart.question ||
+      part == CatechismItemPart.questionAndAnswer ||
+      part == CatechismItemPart.questionAndReferences ||
+      part == CatechismItemPart.all;
+  final inAnswer =
+      part == CatechismItemPart.answer ||
+      part == CatechismItemPart.questionAndAnswer ||
+      part == CatechismItemPart.answerAndReferences ||
+      part == CatechismItemPart.all;
+  final inReferences =
+      part == CatechismItemPart.references ||
+      part == CatechismItemPart.questionAndReferences ||
+      part == CatechismItemPart.answerAndReferences ||
+      part == CatechismItemPart.all;
+
+  return (qa) =>
+      (inQuestion && qa.question.toLowerCase().contains(lowerSearch)) ||
+      (inAnswer && qa.answer.toLowerCase().contains(lowerSearch)) ||
+      (inReferences &&
+          qa.clauses.any(
+            (clause) => clause.proofTexts.any(
+              (proofText) =>
+                  proofText.reference.toLowerCase().contains(lowerSearch),
+            ),
+          ));
+}
@@ -13,6 +13,11 @@ class WestminsterStandards {
   final List<CatechismItem> _shorterCatechism;
   final List<CatechismItem> _largerCatechism;
 
+  // Text-only content is built on first access and reused afterwards
+  String? _confessionTextOnly;
+  String? _shorterCatechismTextOnly;
+  String? _largerCatechismTextOnly;
+
   WestminsterStandards._({
     required List<ConfessionChapter> confession,
     required List<CatechismItem> shorterCatechism,
@@ -43,29 +48,26 @@ class WestminsterStandards {
   ]) async {
     final loader = WestminsterJsonLoader(assetLoader);
 
-    List<ConfessionChapter> confession = [];
-    List<CatechismItem> shorterCatechism = [];
-    List<CatechismItem> largerCatechism = [];
-
-    if (documents == WestminsterDocument.confession ||
-        documents == WestminsterDocument.all) {
-      confession = await loader.loadWestminsterConfession();
-    }
-
-    if (documents == WestminsterDocument.shorterCatechism ||
-        documents == WestminsterDocument.all) {
-      shorterCatechism = await loader.loadWestminsterShorterCatechism();
-    }
-
-    if (documents == WestminsterDocument.largerCatechism ||
-        documents == WestminsterDocument.all) {
-      largerCatechism = await loader.loadWestminsterLargerCatechism();
-    }
+    bool includes(WestminsterDocument document) =>
+        documents == document || documents == WestminsterDocument.all;
+
+    // The documents are independent, so load them concurrently
+    final results = await Future.wait<Object>([
+      includes(WestminsterDocument.confession)
+          ? loader.loadWestminsterConfession()
+          : Future.value(<ConfessionChapter>[]),
+      includes(WestminsterDocument.shorterCatechism)
+          ? loader.loadWestminsterShorterCatechism()
+          : Future.value(<CatechismItem>[]),
+      includes(WestminsterDocument.largerCatechism)
+          ? loader.loadWestminsterLargerCatechism()
+          : Future.value(<CatechismItem>[]),
+    ]);
 
     return WestminsterStandards._(
-      confession: confession,
-      shorterCatechism: shorterCatechism,
-      largerCatechism: largerCatechism,
+      confession: results[0] as List<ConfessionChapter>,
+      shorterCatechism: results[1] as List<CatechismItem>,
+      largerCatechism: results[2] as List<CatechismItem>,
     );
   }
 
@@ -87,15 +89,15 @@ class WestminsterStandards {
     }
   }
 
-  // Enhanced access classes
+  // Enhanced access classes, created once and shared by every accessor
   /// Enhanced access to the Westminster Confession
-  Confession get confession => Confession(_confession);
+  late final Confession confession = Confession(_confession);
 
   /// Enhanced access to the Westminster Shorter Catechism
-  Catechism get shorterCatechism => Catechism(_shorterCatechism);
+  late final Catechism shorterCatechism = Catechism(_shorterCatechism);
 
   /// Enhanced access to the Westminster Larger Catechism
-  Catechism get largerCatechism => Catechism(_largerCatechism);
+  late final Catechism largerCatechism = Catechism(_largerCatechism);
 
   // Synchronous getters for loaded data
   List<ConfessionChapter> get confessionList => _confession;
@@ -103,31 +105,14 @@ class WestminsterStandards {
   List<CatechismItem> get largerCatechismList => _largerCatechism;
 
   // Individual item methods
-  CatechismItem? getShorterCatechismQuestion(int questionNumber) {
-    try {
-      return _shorterCatechism.firstWhere((qa) => qa.number == questionNumber);
-    } catch (e) {
-      return null;
-    }
-  }
+  CatechismItem? getShorterCatechismQuestion(int questionNumber) =>
+      shorterCatechism.getQuestion(questionNumber);
 
-  CatechismItem? getLargerCatechismQuestion(int questionNumber) {
-    try {
-      return _largerCatechism.firstWhere((qa) => qa.number == questionNumber);
-    } catch (e) {
-      return null;
-    }
-  }
+  CatechismItem? getLargerCatechismQuestion(int questionNumber) =>
+      largerCatechism.getQuestion(questionNumber);
 
-  ConfessionChapter? getConfessionChapter(int chapterNumber) {
-    try {
-      return _confession.firstWhere(
-        (chapter) => chapter.number == chapterNumber,
-      );
-    } catch (e) {
-      return null;
-    }
-  }
+  ConfessionChapter? getConfessionChapter(int chapterNumber) =>
+      confession.getChapter(chapterNumber);
 
   // Convenience getters
   CatechismItem? get firstShorterCatechismQuestion =>
@@ -137,41 +122,49 @@ class WestminsterStandards {
   ConfessionChapter? get firstConfessionChapter => getConfessionChapter(1);
 
   // Proof text getters
-  List<ProofText> get allShorterCatechismProofTexts {
-    return _shorterCatechism.expand((qa) => qa.allProofTexts).toList();
-  }
+  List<ProofText> get allShorterCatechismProofTexts =>
+      _shorterCatechismProofTexts.toList();
 
-  List<ProofText> get allLargerCatechismProofTexts {
-    return _largerCatechism.expand((qa) => qa.allProofTexts).toList();
-  }
+  List<ProofText> get allLargerCatechismProofTexts =>
+      _largerCatechismProofTexts.toList();
 
-  List<ProofText> get allConfessionProofTexts {
-    return _confession
-        .expand(
-          (chapter) =>
-              chapter.sections.expand((section) => section.allProofTexts),
-        )
-        .toList();
-  }
+  List<ProofText> get allConfessionProofTexts => _confessionProofTexts.toList();
 
   List<ProofText> get allProofTexts {
+    // Collect from the clauses in one pass rather than copying each
+    // document's list into the combined one
     return [
-      ...allShorterCatechismProofTexts,
-      ...allLargerCatechismProofTexts,
-      ...allConfessionProofTexts,
+      ..._shorterCatechismProofTexts,
+      ..._largerCatechismProofTexts,
+      ..._confessionProofTexts,
     ];
   }
 
+  Iterable<ProofText> get _shorterCatechismProofTexts => _shorterCatechism
+      .expand((qa) => qa.clauses)
+      .expand((clause) => clause.proofTexts);
+
+  Iterable<ProofText> get _largerCatechismProofTexts => _largerCatechism
+      .expand((qa) => qa.clauses)
+      .expand((clause) => clause.proofTexts);
+
+  Iterable<ProofText> get _confessionProofTexts => _confession
+      .expand((chapter) => chapter.sections)
+      .expand((section) => section.clauses)
+      .expand((clause) => clause.proofTexts);
+
   // Text-only access methods (excluding scripture references)
 
   /// Get the full text content of the Westminster Confession (excluding scripture references)
-  String get confessionTextOnly => confession.textOnly;
+  String get confessionTextOnly => _confessionTextOnly ??= confession.textOnly;
 
   /// Get the full text content of the Westminster Shorter Catechism (excluding scripture references)
-  String get shorterCatechismTextOnly => shorterCatechism.textOnly;
+  String get shorterCatechismTextOnly =>
+      _shorterCatechismTextOnly ??= shorterCatechism.textOnly;
 
   /// Get the full text content of the Westminster Larger Catechism (excluding scripture references)
-  String get largerCatechismTextOnly => largerCatechism.textOnly;
+  String get largerCatechismTextOnly =>
+      _largerCatechismTextOnly ??= largerCatechism.textOnly;
 
   /// Get text content of a range of chapters from the Westminster Confession (excluding scripture references)
   String getConfessionRangeTextOnly(int start, int end) =>
@@ -233,6 +226,9 @@ class WestminsterStandards {
 
     // Search in Shorter Catechism
     for (final question in _shorterCatechism) {
+      // Flatten the proof texts at most once per question
+      late final proofTexts = question.allProofTexts;
+
       // Search in question text
       if (searchInTitles &&
           question.question.toLowerCase().contains(lowerSearch)) {
@@ -242,7 +238,7 @@ class WestminsterStandards {
             number: question.number,
             title: question.question,
             content: question.answer,
-            proofTexts: question.allProofTexts,
+            proofTexts: proofTexts,
             matchedText: question.question,
             matchType: SearchMatchType.question,
           ),
@@ -258,7 +254,7 @@ class WestminsterStandards {
             number: question.number,
             title: question.question,
             content: question.answer,
-            proofTexts: question.allProofTexts,
+            proofTexts: proofTexts,
             matchedText: question.answer,
             matchType: SearchMatchType.answer,
           ),
@@ -267,7 +263,7 @@ class WestminsterStandards {
 
       // Search in proof text references
       if (searchInReferences) {
-        for (final proofText in question.allProofTexts) {
+        for (final proofText in proofTexts) {
           if (proofText.reference.toLowerCase().contains(lowerSearch)) {
             results.add(
               WestminsterSearchResult(
@@ -275,7 +271,7 @@ class WestminsterStandards {
                 number: question.number,
                 title: question.question,
                 content: question.answer,
-                proofTexts: question.allProofTexts,
+                proofTexts: proofTexts,
                 matchedText: proofText.reference,
                 matchType: SearchMatchType.references,
               ),
@@ -288,6 +284,9 @@ class WestminsterStandards {
 
     // Search in Larger Catechism
     for (final question in _largerCatechism) {
+      // Flatten the proof texts at most once per question
+      late final proofTexts = question.allProofTexts;
+
       // Search in question text
       if (searchInTitles &&
           question.question.toLowerCase().contains(lowerSearch)) {
@@ -297,7 +296,7 @@ class WestminsterStandards {
             number: question.number,
             title: question.question,
             content: question.answer,
-            proofTexts: question.allProofTexts,
+            proofTexts: proofTexts,
             matchedText: question.question,
             matchType: SearchMatchType.question,
           ),
@@ -313,7 +312,7 @@ class WestminsterStandards {
             number: question.number,
             title: question.question,
             content: question.answer,
-            proofTexts: question.allProofTexts,
+            proofTexts: proofTexts,
             matchedText: question.answer,
             matchType: SearchMatchType.answer,
           ),
@@ -322,7 +321,7 @@ class WestminsterStandards {
 
       // Search in proof text references
       if (searchInReferences) {
-        for (final proofText in question.allProofTexts) {
+        for (final proofText in proofTexts) {
           if (proofText.reference.toLowerCase().contains(lowerSearch)) {
             results.add(
               WestminsterSearchResult(
@@ -330,7 +329,7 @@ class WestminsterStandards {
                 number: question.number,
                 title: question.question,
                 content: question.answer,
-                proofTexts: question.allProofTexts,
+                proofTexts: proofTexts,
                 matchedText: proofText.reference,
                 matchType: SearchMatchType.references,
               ),
@@ -343,6 +342,11 @@ class WestminsterStandards {
 
     // Search in Confession
     for (final chapter in _confession) {
+      // Build the joined content and proof texts at most once per chapter
+      late final content = chapter.sections.map((s) => s.text).join(' ');
+      late final proofTexts =
+          chapter.sections.expand((s) => s.allProofTexts).toList();
+
       // Search in chapter title
       if (searchInTitles && chapter.title.toLowerCase().contains(lowerSearch)) {
         results.add(
@@ -350,9 +354,8 @@ class WestminsterStandards {
             documentType: WestminsterDocumentType.confession,
             number: chapter.number,
             title: chapter.title,
-            content: chapter.sections.map((s) => s.text).join(' '),
-            proofTexts:
-                chapter.sections.expand((s) => s.allProofTexts).toList(),
+            content: content,
+            proofTexts: proofTexts,
             matchedText: chapter.title,
             matchType: SearchMatchType.title,
           ),
@@ -368,9 +371,8 @@ class WestminsterStandards {
                 documentType: WestminsterDocumentType.confession,
                 number: chapter.number,
                 title: chapter.title,
-                content: chapter.sections.map((s) => s.text).join(' '),
-                proofTexts:
-                    chapter.sections.expand((s) => s.allProofTexts).toList(),
+                content: content,
+                proofTexts: proofTexts,
                 matchedText: section.text,
                 matchType: SearchMatchType.content,
               ),
@@ -382,25 +384,26 @@ class WestminsterStandards {
 
       // Search in proof text references
       if (searchInReferences) {
-        for (final section in chapter.sections) {
-          for (final proofText in section.allProofTexts) {
-            if (proofText.reference.toLowerCase().contains(lowerSearch)) {
-              results.add(
-                WestminsterSearchResult(
-                  documentType: WestminsterDocumentType.confession,
-                  number: chapter.number,
-                  title: chapter.title,
-                  content: chapter.sections.map((s) => s.text).join(' '),
-                  proofTexts:
-                      chapter.sections.expand((s) => s.allProofTexts).toList(),
-                  matchedText: proofText.reference,
-                  matchType: SearchMatchType.references,
-                ),
-              );
-              break; // Only add once per chapter even if multiple references match
-            }
-          }
-          break; // Only add once per chapter even if multiple sections have matching references
+        final matchingProofTexts = chapter.sections
+            .expand((section) => section.clauses)
+            .expand((clause) => clause.proofTexts)
+            .where(
+              (proofText) =>
+                  proofText.reference.toLowerCase().contains(lowerSearch),
+            );
+        for (final proofText in matchingProofTexts) {
+          results.add(
+            WestminsterSearchResult(
+              documentType: WestminsterDocumentType.confession,
+              number: chapter.number,
+              title: chapter.title,
+              content: content,
+              proofTexts: proofTexts,
+              matchedText: proofText.reference,
+              matchType: SearchMatchType.references,
+            ),
+          );
+          break; // Only add once per chapter even if multiple references match
         }
       }
     }
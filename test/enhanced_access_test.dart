@@ -17,5 +17,24 @@ void main() {
       final godChapters = standards.confession.exactStr('God');
       expect(godChapters, isNotEmpty);
     });
+
+    test('should look up questions by number in any order', () {
+      CatechismItem item(int number) => CatechismItem(
+        number: number,
+        question: 'Question $number',
+        answer: 'Answer $number',
+        clauses: const [],
+      );
+
+      final ordered = Catechism([item(1), item(2), item(3)]);
+      expect(ordered.getQuestion(2)?.number, equals(2));
+      expect(ordered.getQuestion(0), isNull);
+      expect(ordered.getQuestion(4), isNull);
+
+      final unordered = Catechism([item(3), item(1), item(2)]);
+      expect(unordered.getQuestion(1)?.number, equals(1));
+      expect(unordered.getQuestion(3)?.number, equals(3));
+      expect(unordered.getQuestion(5), isNull);
+    });
   });
 }
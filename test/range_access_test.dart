@@ -17,5 +17,22 @@ void main() {
       expect(chapters.first.number, equals(1));
       expect(chapters.last.number, equals(2));
     });
+
+    test('should return ranges from unordered data', () {
+      CatechismItem item(int number) => CatechismItem(
+        number: number,
+        question: 'Question $number',
+        answer: 'Answer $number',
+        clauses: const [],
+      );
+
+      final ordered = Catechism([item(1), item(2), item(3), item(4)]);
+      expect(ordered.range(2, 3).map((qa) => qa.number), equals([2, 3]));
+      expect(ordered.range(0, 9).map((qa) => qa.number), equals([1, 2, 3, 4]));
+      expect(ordered.range(3, 2), isEmpty);
+
+      final unordered = Catechism([item(1), item(5), item(3)]);
+      expect(unordered.range(1, 3).map((qa) => qa.number), equals([1, 3]));
+    });
   });
 }
@@ -0,0 +1,50 @@
+import 'package:test/test.dart';
+import 'package:dart_westminster_standards/dart_westminster_standards.dart';
+
+void main() {
+  group('String Extensions Tests', () {
+    test('should count words separated by any whitespace', () {
+      expect(''.wordCount, equals(0));
+      expect('   '.wordCount, equals(0));
+      expect('God is a Spirit'.wordCount, equals(4));
+      expect('  God\tis\n\na Spirit  '.wordCount, equals(4));
+      expect('infinite,\u00a0eternal'.wordCount, equals(2));
+    });
+
+    test('should collapse whitespace when normalizing', () {
+      expect('  God is\n\n  a\tSpirit  '.normalized, equals('God is a Spirit'));
+      expect('\n \n'.normalized, equals(''));
+    });
+
+    test('should handle text with and without scripture references', () {
+      const plain = ' God is a Spirit ';
+      expect(plain.withoutScriptureReferences, equals('God is a Spirit'));
+      expect(plain.scriptureReferences, isEmpty);
+      expect(plain.hasScriptureReferences, isFalse);
+      expect(plain.withScriptureLinks, equals(plain));
+
+      const cited = 'God is a Spirit [John 4:24]';
+      expect(cited.withoutScriptureReferences, equals('God is a Spirit'));
+      expect(cited.scriptureReferences, equals(['John 4:24']));
+      expect(cited.hasScriptureReferences, isTrue);
+      expect(
+        cited.withScriptureLinks,
+        equals('God is a Spirit [John 4:24](scripture://John 4:24)'),
+      );
+      expect('God [is'.hasScriptureReferences, isFalse);
+    });
+
+    test('should highlight search terms literally', () {
+      expect(
+        'God is a Spirit'.highlightSearchTerm('god'),
+        equals('**God** is a Spirit'),
+      );
+      expect(
+        'Ps 19:1-3 (a)'.highlightSearchTerm('(a)'),
+        equals('Ps 19:1-3 **(a)**'),
+      );
+      expect('Ps 19:1'.highlightSearchTerm('.*'), equals('Ps 19:1'));
+      expect('Ps 19:1'.highlightSearchTerm(''), equals('Ps 19:1'));
+    });
+  });
+}
@@ -29,5 +29,70 @@ void main() {
         );
       },
     );
+
+    test('should match confession references in any section', () async {
+      const confessionJson = '''
+{"chapters": [{"number": 1, "title": "Of the Holy Scripture", "sections": [
+  {"number": 1, "text": "First", "clauses": [{"text": "First", "proofTexts":
+    [{"reference": "Rom 1:19", "text": "..."}]}]},
+  {"number": 2, "text": "Second", "clauses": [{"text": "Second", "proofTexts":
+    [{"reference": "Eph 2:20", "text": "..."}]}]}
+]}]}''';
+      final loader =
+          MemoryAssetLoader({
+            'assets/confession/westminster_confession.json': confessionJson,
+          }).create();
+      final standards = await WestminsterStandards.createWithLoader(
+        loader,
+        WestminsterDocument.confession,
+      );
+
+      final results = standards.searchAll(
+        'Eph 2',
+        searchInTitles: false,
+        searchInContent: false,
+      );
+
+      expect(results, hasLength(1));
+      expect(results.single.matchType, equals(SearchMatchType.references));
+      expect(results.single.matchedText, equals('Eph 2:20'));
+    });
+
+    test('should summarize search results by document and match type', () {
+      WestminsterSearchResult result(
+        WestminsterDocumentType documentType,
+        SearchMatchType matchType,
+      ) {
+        return WestminsterSearchResult(
+          documentType: documentType,
+          number: 1,
+          title: 'Title',
+          content: 'Content',
+          proofTexts: const [],
+          matchedText: 'Content',
+          matchType: matchType,
+        );
+      }
+
+      final results = [
+        result(
+          WestminsterDocumentType.shorterCatechism,
+          SearchMatchType.question,
+        ),
+        result(WestminsterDocumentType.confession, SearchMatchType.content),
+        result(
+          WestminsterDocumentType.shorterCatechism,
+          SearchMatchType.answer,
+        ),
+      ];
+
+      expect(
+        results.searchSummary,
+        equals(
+          'Found 3 results (shorterCatechism: 2, confession: 1) - '
+          'Match types: question: 1, content: 1, answer: 1',
+        ),
+      );
+    });
   });
 }
@@ -17,5 +17,48 @@ void main() {
       final standards = await WestminsterStandards.create();
       expect(standards.largerCatechismList, isNotEmpty);
     });
+
+    test('should share a pending asset load between callers', () async {
+      var loads = 0;
+      final loader =
+          CachingAssetLoader((assetPath) async {
+            loads++;
+            return 'content';
+          }).create();
+
+      final contents = await Future.wait([loader('a.json'), loader('a.json')]);
+
+      expect(contents, equals(['content', 'content']));
+      expect(loads, equals(1));
+    });
+
+    test('should share identical proof texts between clauses', () async {
+      const proofText = '{"reference": "Rom 11:36", "text": "For of him..."}';
+      const catechismJson =
+          '[{"number": 1, "question": "Q1", "answer": "A1", "clauses": '
+          '[{"text": "A1", "footnote": 1, "references": [$proofText]}]}, '
+          '{"number": 2, "question": "Q2", "answer": "A2", "clauses": '
+          '[{"text": "A2", "footnote": 1, "references": [$proofText]}]}]';
+      final loader =
+          MemoryAssetLoader({
+            'assets/catechisms/shorter/westminster_shorter_catechism.json':
+                catechismJson,
+          }).create();
+
+      final standards = await WestminsterStandards.createWithLoader(
+        loader,
+        WestminsterDocument.shorterCatechism,
+      );
+      final questions = standards.shorterCatechismList;
+
+      expect(questions, hasLength(2));
+      expect(
+        identical(
+          questions[0].allProofTexts.single,
+          questions[1].allProofTexts.single,
+        ),
+        isTrue,
+      );
+    });
   });
 }